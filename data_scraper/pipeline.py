@@ -1,15 +1,19 @@
 """
 데이터 수집 파이프라인 오케스트레이터
 """
-import pandas as pd
+import asyncio
+import csv
+import uuid
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import BinaryIO, Iterator, List, Dict, Optional
 from datetime import datetime
-import json
 
 from .scrapers.brand_crawler import BrandCrawler
+from .scrapers.browser_pool import BrowserPool
 from .scrapers.product_scraper import ProductScraper
 from .utils.config import Config
+from .utils.json_utils import dumps_line, dumps_pretty, loads
 from .utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -21,14 +25,61 @@ class DataPipeline:
     def __init__(self):
         """파이프라인 초기화"""
         Config.create_directories()
-        self.results = []
+
+        # 수집 결과는 메모리에 쌓지 않고 JSONL 파일에 한 줄씩 기록
+        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 같은 초에 만든 파이프라인끼리 파일을 공유하지 않도록 인스턴스마다 고유한 이름 사용
+        self.jsonl_path = (
+            Config.CSV_OUTPUT_PATH / f"musinsa_products_{self.timestamp}_{uuid.uuid4().hex[:8]}.jsonl"
+        )
+        self.result_count = 0
+        self._jsonl: Optional[BinaryIO] = None
+
+    def _add_result(self, product_data: Dict):
+        """수집 결과 1건을 JSONL 파일에 기록"""
+        if self._jsonl is None:
+            # 첫 기록은 새 파일로 만들고, close() 후 다시 기록할 때만 이어 쓰기
+            mode = 'ab' if self.result_count else 'xb'
+            self._jsonl = open(self.jsonl_path, mode, buffering=Config.WRITE_BUFFER_SIZE)
+
+        # 바이트로 바로 직렬화해 문자열 인코딩 단계 생략
+        self._jsonl.write(dumps_line(product_data) + b"\n")
+        self.result_count += 1
+
+    def iter_results(self) -> Iterator[Dict]:
+        """JSONL 파일에서 수집 결과를 한 건씩 읽기"""
+        if not self.result_count:
+            return
+
+        self.flush()
+        with open(self.jsonl_path, 'rb') as f:
+            for line in f:
+                yield loads(line)
+
+    def flush(self):
+        """버퍼에 남은 수집 결과를 JSONL 파일에 반영"""
+        if self._jsonl:
+            self._jsonl.flush()
+
+    def close(self):
+        """JSONL 파일 닫기"""
+        if self._jsonl:
+            self._jsonl.close()
+            self._jsonl = None
+
+    def __enter__(self) -> "DataPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def run_brand_pipeline(
         self,
         brand_names: List[str],
         max_products_per_brand: Optional[int] = None,
         download_images: bool = True,
-        headless: bool = True
+        headless: bool = True,
+        use_browser: bool = False
     ):
         """
         브랜드별 데이터 수집 파이프라인 실행
@@ -38,52 +89,87 @@ class DataPipeline:
             max_products_per_brand: 브랜드당 최대 상품 수
             download_images: 이미지 다운로드 여부
             headless: 헤드리스 모드 여부
+            use_browser: 상품 목록 수집 시 JSON API 대신 브라우저 사용 여부
         """
+        try:
+            asyncio.run(
+                self._run_brand_pipeline(
+                    brand_names,
+                    max_products_per_brand,
+                    download_images,
+                    headless,
+                    use_browser
+                )
+            )
+        finally:
+            # 중간에 실패해도 그때까지 수집한 결과는 파일에 남김
+            self.flush()
+
+    async def _run_brand_pipeline(
+        self,
+        brand_names: List[str],
+        max_products_per_brand: Optional[int],
+        download_images: bool,
+        headless: bool,
+        use_browser: bool
+    ):
+        """브랜드별 데이터 수집 (1·2단계가 하나의 브라우저 풀을 공유)"""
         logger.info("=" * 60)
         logger.info("무신사 데이터 수집 파이프라인 시작")
         logger.info(f"타겟 브랜드: {', '.join(brand_names)}")
         logger.info("=" * 60)
 
-        # 1단계: 브랜드별 상품 ID 수집
-        logger.info("\n[1단계] 브랜드별 상품 목록 수집")
-        with BrandCrawler(headless=headless) as crawler:
-            brand_products = crawler.get_brand_products_multi(
-                brand_names,
-                max_products_per_brand or Config.MAX_PRODUCTS_PER_BRAND
-            )
-
-        # 수집된 상품 ID 요약
-        total_products = sum(len(ids) for ids in brand_products.values())
-        logger.info(f"총 {total_products}개 상품 발견")
-        for brand, ids in brand_products.items():
-            logger.info(f"  - {brand}: {len(ids)}개")
-
-        # 2단계: 상품 상세 정보 및 이미지 수집
-        logger.info("\n[2단계] 상품 상세 정보 및 이미지 수집")
-        with ProductScraper(headless=headless) as scraper:
-            for brand, product_ids in brand_products.items():
-                logger.info(f"\n브랜드: {brand}")
-
-                for idx, product_id in enumerate(product_ids, 1):
-                    logger.info(f"  [{idx}/{len(product_ids)}] 상품 ID: {product_id}")
-
-                    product_data = scraper.scrape_product(
-                        product_id,
-                        download_images=download_images
-                    )
+        # 브라우저는 1·2단계 중 실제로 필요해질 때만 실행 (두 단계 모두 이미지 렌더링 불필요)
+        async with BrowserPool(headless=headless, block_images=True) as pool:
+            # 1단계: 브랜드별 상품 ID 수집
+            logger.info("\n[1단계] 브랜드별 상품 목록 수집")
+            async with BrandCrawler(headless=headless, use_browser=use_browser, pool=pool) as crawler:
+                brand_products = await crawler.get_brand_products_multi(
+                    brand_names,
+                    max_products_per_brand or Config.MAX_PRODUCTS_PER_BRAND
+                )
+
+            # 수집된 상품 ID 요약
+            total_products = sum(len(ids) for ids in brand_products.values())
+            logger.info(f"총 {total_products}개 상품 발견")
+            for brand, ids in brand_products.items():
+                logger.info(f"  - {brand}: {len(ids)}개")
+
+            # 2단계: 상품 상세 정보 및 이미지 수집 (Config.MAX_CONCURRENCY개씩 동시 진행)
+            logger.info("\n[2단계] 상품 상세 정보 및 이미지 수집")
+            semaphore = asyncio.Semaphore(Config.MAX_CONCURRENCY)
+
+            async with ProductScraper(headless=headless, pool=pool) as scraper:
+                async def scrape_one(brand: str, product_id: str, idx: int, total: int):
+                    async with semaphore:
+                        logger.info("  [%s %d/%d] 상품 ID: %s", brand, idx, total, product_id)
+
+                        product_data = await scraper.scrape_product(
+                            product_id,
+                            download_images=download_images
+                        )
 
                     if product_data:
                         product_data['target_brand'] = brand
-                        self.results.append(product_data)
+                        self._add_result(product_data)
 
-        logger.info(f"\n총 {len(self.results)}개 상품 정보 수집 완료")
+                tasks = []
+                for brand, product_ids in brand_products.items():
+                    total = len(product_ids)
+                    for idx, product_id in enumerate(product_ids, 1):
+                        tasks.append(scrape_one(brand, product_id, idx, total))
+
+                await asyncio.gather(*tasks)
+
+        logger.info(f"\n총 {self.result_count}개 상품 정보 수집 완료")
 
     def run_recommend_pipeline(
         self,
         gender_filter: str = 'A',
         max_products: Optional[int] = None,
         download_images: bool = True,
-        headless: bool = True
+        headless: bool = True,
+        use_browser: bool = False
     ):
         """
         추천 페이지 데이터 수집 파이프라인 실행
@@ -93,31 +179,55 @@ class DataPipeline:
             max_products: 최대 상품 수
             download_images: 이미지 다운로드 여부
             headless: 헤드리스 모드 여부
+            use_browser: 상품 목록 수집 시 JSON API 대신 브라우저 사용 여부
         """
+        try:
+            asyncio.run(
+                self._run_recommend_pipeline(
+                    gender_filter,
+                    max_products,
+                    download_images,
+                    headless,
+                    use_browser
+                )
+            )
+        finally:
+            # 중간에 실패해도 그때까지 수집한 결과는 파일에 남김
+            self.flush()
+
+    async def _run_recommend_pipeline(
+        self,
+        gender_filter: str,
+        max_products: Optional[int],
+        download_images: bool,
+        headless: bool,
+        use_browser: bool
+    ):
+        """추천 페이지 데이터 수집 (1·2단계가 하나의 브라우저 풀을 공유)"""
         logger.info("=" * 60)
         logger.info("무신사 추천 페이지 데이터 수집 파이프라인 시작")
         logger.info("=" * 60)
 
-        # 1단계: 추천 상품 ID 수집
-        logger.info("\n[1단계] 추천 상품 목록 수집")
-        with BrandCrawler(headless=headless) as crawler:
-            product_ids = crawler.get_recommend_products(
-                gender_filter,
-                max_products or Config.MAX_PRODUCTS_PER_BRAND
-            )
+        # 브라우저는 1·2단계 중 실제로 필요해질 때만 실행 (두 단계 모두 이미지 렌더링 불필요)
+        async with BrowserPool(headless=headless, block_images=True) as pool:
+            # 1단계: 추천 상품 ID 수집
+            logger.info("\n[1단계] 추천 상품 목록 수집")
+            async with BrandCrawler(headless=headless, use_browser=use_browser, pool=pool) as crawler:
+                product_ids = await crawler.get_recommend_products(
+                    gender_filter,
+                    max_products or Config.MAX_PRODUCTS_PER_BRAND
+                )
 
-        logger.info(f"총 {len(product_ids)}개 추천 상품 발견")
+            logger.info(f"총 {len(product_ids)}개 추천 상품 발견")
 
-        # 2단계: 상품 상세 정보 및 이미지 수집
-        logger.info("\n[2단계] 상품 상세 정보 및 이미지 수집")
-        with ProductScraper(headless=headless) as scraper:
-            products = scraper.scrape_products(
-                product_ids,
-                delay=Config.DELAY_BETWEEN_REQUESTS
-            )
-            self.results.extend(products)
+            # 2단계: 상품 상세 정보 및 이미지 수집
+            logger.info("\n[2단계] 상품 상세 정보 및 이미지 수집")
+            async with ProductScraper(headless=headless, pool=pool) as scraper:
+                products = await scraper.scrape_products(product_ids)
+                for product_data in products:
+                    self._add_result(product_data)
 
-        logger.info(f"\n총 {len(self.results)}개 상품 정보 수집 완료")
+        logger.info(f"\n총 {self.result_count}개 상품 정보 수집 완료")
 
     def save_to_csv(self, filename: Optional[str] = None) -> Path:
         """
@@ -129,21 +239,32 @@ class DataPipeline:
         Returns:
             저장된 파일 경로
         """
-        if not self.results:
+        if not self.result_count:
             logger.warning("저장할 데이터가 없습니다.")
             return None
 
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"musinsa_products_{timestamp}.csv"
+            filename = f"musinsa_products_{self.timestamp}.csv"
 
         output_path = Config.CSV_OUTPUT_PATH / filename
 
-        # DataFrame 생성
-        df = pd.DataFrame(self.results)
+        # 전체 컬럼 목록 (처음 등장한 순서 유지)
+        fieldnames = list(dict.fromkeys(
+            key for product_data in self.iter_results() for key in product_data
+        ))
+
+        # CSV 저장 (JSONL 파일을 한 건씩 기록)
+        with open(
+            output_path,
+            'w',
+            encoding='utf-8-sig',
+            newline='',
+            buffering=Config.WRITE_BUFFER_SIZE
+        ) as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(self.iter_results())
 
-        # CSV 저장
-        df.to_csv(output_path, index=False, encoding='utf-8-sig')
         logger.info(f"CSV 저장 완료: {output_path}")
 
         return output_path
@@ -158,41 +279,59 @@ class DataPipeline:
         Returns:
             저장된 파일 경로
         """
-        if not self.results:
+        if not self.result_count:
             logger.warning("저장할 데이터가 없습니다.")
             return None
 
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"musinsa_products_{timestamp}.json"
+            filename = f"musinsa_products_{self.timestamp}.json"
 
         output_path = Config.CSV_OUTPUT_PATH / filename
 
-        # JSON 저장
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, ensure_ascii=False, indent=2)
+        # JSON 저장 (JSONL 파일을 한 건씩 배열로 변환)
+        with open(output_path, 'wb', buffering=Config.WRITE_BUFFER_SIZE) as f:
+            f.write(b'[')
+            for idx, product_data in enumerate(self.iter_results()):
+                f.write(b',\n  ' if idx else b'\n  ')
+                f.write(dumps_pretty(product_data).replace(b'\n', b'\n  '))
+            f.write(b'\n]')
 
         logger.info(f"JSON 저장 완료: {output_path}")
 
         return output_path
 
     def get_summary(self) -> Dict:
-        """수집 결과 요약"""
-        if not self.results:
+        """수집 결과 요약 (JSONL 파일을 한 번만 순회)"""
+        if not self.result_count:
             return {"message": "수집된 데이터가 없습니다."}
 
-        df = pd.DataFrame(self.results)
+        total_products = 0
+        products_with_images = 0
+        total_images = 0
+        brand_counts = Counter()
+        target_brand_counts = Counter()
+
+        for product_data in self.iter_results():
+            total_products += 1
+            if product_data.get('downloaded_images'):
+                products_with_images += 1
+            total_images += product_data.get('image_count', 0)
+
+            if brand := product_data.get('brand'):
+                brand_counts[brand] += 1
+            if target_brand := product_data.get('target_brand'):
+                target_brand_counts[target_brand] += 1
 
         summary = {
-            "total_products": len(self.results),
-            "products_with_images": len([r for r in self.results if r.get('downloaded_images')]),
-            "total_images": sum(r.get('image_count', 0) for r in self.results),
+            "total_products": total_products,
+            "products_with_images": products_with_images,
+            "total_images": total_images,
         }
 
-        if 'brand' in df.columns:
-            summary['brands'] = df['brand'].value_counts().to_dict()
+        if brand_counts:
+            summary['brands'] = dict(brand_counts.most_common())
 
-        if 'target_brand' in df.columns:
-            summary['target_brands'] = df['target_brand'].value_counts().to_dict()
+        if target_brand_counts:
+            summary['target_brands'] = dict(target_brand_counts.most_common())
 
         return summary
@@ -0,0 +1,150 @@
+"""
+브랜드별 상품 목록 API 클라이언트 (httpx 기반)
+
+브라우저 없이 무신사 검색/추천 JSON API를 직접 호출하여 상품 ID를 수집합니다.
+"""
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from ..utils.config import Config
+from ..utils.logger import setup_logger
+from ..utils.rate_limiter import HostRateLimiter
+
+logger = setup_logger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/json',
+    'Referer': f"{Config.BASE_URL}/",
+}
+
+
+class BrandApiClient:
+    """무신사 검색/추천 JSON API 클라이언트"""
+
+    def __init__(
+        self,
+        rate_limiter: Optional[HostRateLimiter] = None
+    ):
+        """
+        Args:
+            rate_limiter: 호스트별 요청 속도 제한기 (기본: Config.REQS_PER_SEC)
+        """
+        self.rate_limiter = rate_limiter or HostRateLimiter(Config.REQS_PER_SEC)
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "BrandApiClient":
+        self.client = httpx.AsyncClient(
+            http2=True,
+            headers=DEFAULT_HEADERS,
+            timeout=Config.PAGE_LOAD_TIMEOUT,
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def search_brand_products(
+        self,
+        brand_name: str,
+        max_products: Optional[int] = None
+    ) -> List[str]:
+        """
+        검색 API로 브랜드 상품 ID 목록 추출
+
+        Args:
+            brand_name: 브랜드명
+            max_products: 최대 상품 수
+
+        Returns:
+            상품 ID 리스트
+        """
+        params = {
+            'keyword': brand_name,
+            'size': max_products or Config.MAX_PRODUCTS_PER_BRAND,
+        }
+
+        try:
+            logger.info(f"브랜드 '{brand_name}' 검색 API 호출")
+            payload = await self._get_json(Config.SEARCH_API_URL, params)
+            product_ids = self._extract_goods_ids(payload, max_products)
+
+            logger.info(f"브랜드 '{brand_name}': {len(product_ids)}개 상품 발견")
+            return product_ids
+
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"브랜드 '{brand_name}' 검색 API 실패: {e}")
+            return []
+
+    async def get_recommend_products(
+        self,
+        gender_filter: str = 'A',
+        max_products: Optional[int] = None
+    ) -> List[str]:
+        """
+        추천 API에서 상품 ID 추출
+
+        Args:
+            gender_filter: 성별 필터 (A: 전체, M: 남성, W: 여성)
+            max_products: 최대 상품 수
+
+        Returns:
+            상품 ID 리스트
+        """
+        params = {
+            'gf': gender_filter,
+            'size': max_products or Config.MAX_PRODUCTS_PER_BRAND,
+        }
+
+        try:
+            logger.info(f"추천 API 호출: {Config.RECOMMEND_API_URL}")
+            payload = await self._get_json(Config.RECOMMEND_API_URL, params)
+            product_ids = self._extract_goods_ids(payload, max_products)
+
+            logger.info(f"추천 API에서 {len(product_ids)}개 상품 발견")
+            return product_ids
+
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"추천 API 호출 실패: {e}")
+            return []
+
+    async def _get_json(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET 요청 후 JSON 응답 반환"""
+        await self.rate_limiter.acquire(url)
+        response = await self.client.get(url, params=params)
+        if response.status_code == 429:
+            self.rate_limiter.slow_down(url)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _extract_goods_ids(
+        payload: Dict[str, Any],
+        max_products: Optional[int] = None
+    ) -> List[str]:
+        """API 응답(data.list[].goodsNo)에서 상품 ID 추출"""
+        goods_list = (payload.get('data') or {}).get('list') or []
+
+        product_ids = []
+        seen = set()
+        for goods in goods_list:
+            goods_no = goods.get('goodsNo')
+            if goods_no is None:
+                continue
+
+            product_id = str(goods_no)
+            if product_id not in seen:
+                seen.add(product_id)
+                product_ids.append(product_id)
+
+                if max_products and len(product_ids) >= max_products:
+                    break
+
+        return product_ids
+
+    async def close(self):
+        """HTTP 클라이언트 종료"""
+        if self.client:
+            await self.client.aclose()
+            self.client = None
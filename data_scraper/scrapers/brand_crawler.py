@@ -1,67 +1,91 @@
 """
-브랜드별 상품 목록 크롤러 (Playwright 기반)
+브랜드별 상품 목록 크롤러 (JSON API 기본, Playwright 폴백)
 """
-import time
-from playwright.sync_api import sync_playwright, Browser, Page, Playwright
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from __future__ import annotations
+
+import asyncio
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING, List, Dict, Optional
 import re
 
 from ..utils.logger import setup_logger
 from ..utils.config import Config
+from ..utils.rate_limiter import HostRateLimiter
+from .brand_api import BrandApiClient
+from .browser_pool import BrowserPool, resource_blocker
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page
 
 logger = setup_logger(__name__)
 
+SEARCH_INPUT_SELECTOR = 'input[type="search"], input.search-input'
+PRODUCT_LINK_SELECTOR = 'a[href*="/products/"]'
+PRODUCT_ID_RE = re.compile(r'/products/(\d+)')
+
+# 페이지에 렌더링된 고유 상품 ID 개수 (인자: 상품 링크 셀렉터)
+COUNT_PRODUCTS_JS = (
+    r'sel => new Set(Array.from(document.querySelectorAll(sel), '
+    r'a => (/\/products\/(\d+)/.exec(a.getAttribute("href") || "") || [])[1])'
+    r'.filter(Boolean)).size'
+)
+
+# 요소 대기 타임아웃 (ms)
+ELEMENT_WAIT_TIMEOUT = 5000
+
+# 상품 ID 추출에 불필요한 리소스 (네트워크 요청 자체를 차단)
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media', 'stylesheet'}
+TRACKER_URL_RE = re.compile(
+    r'google-analytics\.com|googletagmanager\.com|gtag/js|doubleclick\.net|'
+    r'facebook\.(?:net|com)/tr|connect\.facebook\.net|criteo\.(?:com|net)|'
+    r'analytics\.tiktok\.com|kakao\.com/.*pixel|wcs\.naver\.net|hotjar\.com'
+)
+
+_block_heavy_resources = resource_blocker(BLOCKED_RESOURCE_TYPES, TRACKER_URL_RE)
+
 
 class BrandCrawler:
-    """브랜드별 상품 목록 크롤러 (Playwright)"""
+    """브랜드별 상품 목록 크롤러 (JSON API / Playwright)"""
 
-    def __init__(self, headless: bool = True):
+    def __init__(
+        self,
+        headless: bool = True,
+        use_browser: bool = False,
+        pool: Optional[BrowserPool] = None
+    ):
         """
         Args:
             headless: 헤드리스 모드 여부
+            use_browser: True면 JSON API 대신 Playwright 브라우저로 크롤링
+            pool: 공유 브라우저 풀 (없으면 필요 시 직접 생성)
         """
         self.headless = headless
-        self.playwright: Optional[Playwright] = None
-        self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
-
-    def __enter__(self):
-        self._init_browser()
+        self.use_browser = use_browser
+        self.pool = pool
+        self.api: Optional[BrandApiClient] = None
+        self.rate_limiter = HostRateLimiter(Config.REQS_PER_SEC)
+        self._exit_stack = AsyncExitStack()
+
+    async def __aenter__(self):
+        # API 모드에서도 추천 API 실패 시 브라우저로 폴백하므로 풀을 준비 (브라우저는 필요할 때 실행)
+        if self.pool is None:
+            self.pool = await self._exit_stack.enter_async_context(
+                BrowserPool(headless=self.headless, block_images=True)
+            )
+        if not self.use_browser:
+            self.api = await self._exit_stack.enter_async_context(
+                BrandApiClient(rate_limiter=self.rate_limiter)
+            )
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
-
-    def _init_browser(self):
-        """Playwright 브라우저 초기화"""
-        self.playwright = sync_playwright().start()
-
-        self.browser = self.playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-            ]
-        )
-
-        # 새 컨텍스트 생성
-        context = self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        )
-
-        self.page = context.new_page()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
 
-        # 기본 타임아웃 설정
-        self.page.set_default_timeout(Config.PAGE_LOAD_TIMEOUT * 1000)
-
-        logger.info("Playwright 브라우저 초기화 완료")
-
-    def search_brand_products(
+    async def search_brand_products(
         self,
         brand_name: str,
-        max_products: Optional[int] = None
+        max_products: Optional[int] = None,
+        context: Optional[BrowserContext] = None
     ) -> List[str]:
         """
         브랜드 검색 후 상품 ID 목록 추출
@@ -69,73 +93,115 @@ class BrandCrawler:
         Args:
             brand_name: 브랜드명
             max_products: 최대 상품 수
+            context: 사용할 브라우저 컨텍스트 (없으면 작업 전용 컨텍스트 생성 후 종료)
 
         Returns:
             상품 ID 리스트
         """
+        if not self.use_browser:
+            return await self.api.search_brand_products(brand_name, max_products)
+
+        from playwright.async_api import Error as PlaywrightError
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        owned_context = context is None
+        if owned_context:
+            context = await self.pool.new_context()
+        page = await self._new_page(context)
+
         try:
             logger.info(f"브랜드 '{brand_name}' 검색 시작")
 
             # 무신사 메인 페이지 이동
-            self.page.goto(Config.BASE_URL, wait_until='networkidle')
-            self.page.wait_for_timeout(2000)
+            await self._goto(page, Config.BASE_URL)
 
             # 검색창 찾기 및 검색
-            search_input = self.page.query_selector('input[type="search"], input.search-input')
-            if search_input:
-                search_input.fill(brand_name)
-                search_input.press('Enter')
+            try:
+                search_input = await page.wait_for_selector(
+                    SEARCH_INPUT_SELECTOR,
+                    timeout=ELEMENT_WAIT_TIMEOUT
+                )
+            except PlaywrightTimeoutError:
+                search_input = None
+
+            # 검색창이 없으면 메인 페이지 상품이 브랜드 상품으로 섞이지 않도록 중단
+            if not search_input:
+                logger.warning(f"검색창을 찾을 수 없어 브랜드 '{brand_name}' 검색을 건너뜁니다.")
+                return []
+
+            await search_input.fill(brand_name)
+            await search_input.press('Enter')
+
+            # 검색 결과 로딩 대기
+            await self._wait_for_products(page)
+
+            # 브랜드 필터 적용 시도 (브랜드명을 XPath에 직접 넣지 않고 접근성 이름으로 매칭)
+            try:
+                brand_filter = page.get_by_role('link', name=brand_name).first
+                if await brand_filter.count():
+                    await brand_filter.click()
+                    await page.wait_for_load_state('networkidle')
+            except PlaywrightError:
+                logger.warning("브랜드 필터를 찾을 수 없습니다. 검색 결과를 그대로 사용합니다.")
 
-                # 검색 결과 로딩 대기
-                self.page.wait_for_timeout(3000)
-
-                # 브랜드 필터 적용 시도
-                try:
-                    brand_filter = self.page.query_selector(f'xpath=//a[contains(text(), "{brand_name}")]')
-                    if brand_filter:
-                        brand_filter.click()
-                        self.page.wait_for_timeout(2000)
-                except:
-                    logger.warning("브랜드 필터를 찾을 수 없습니다. 검색 결과를 그대로 사용합니다.")
-
-                # 상품 ID 추출
-                product_ids = self._extract_product_ids(max_products)
+            # 상품 ID 추출
+            product_ids = await self._extract_product_ids(page, max_products)
 
-                logger.info(f"브랜드 '{brand_name}': {len(product_ids)}개 상품 발견")
-                return product_ids
+            logger.info(f"브랜드 '{brand_name}': {len(product_ids)}개 상품 발견")
+            return product_ids
 
         except Exception as e:
             logger.error(f"브랜드 '{brand_name}' 검색 실패: {e}")
             return []
 
-    def get_recommend_products(
+        finally:
+            await page.close()
+            if owned_context:
+                await context.close()
+
+    async def get_recommend_products(
         self,
         gender_filter: str = 'A',
-        max_products: Optional[int] = None
+        max_products: Optional[int] = None,
+        context: Optional[BrowserContext] = None
     ) -> List[str]:
         """
         추천 페이지에서 상품 ID 추출
 
+        API 모드에서 추천 API가 실패하거나 빈 결과를 반환하면 브라우저로 다시 시도합니다.
+
         Args:
             gender_filter: 성별 필터 (A: 전체, M: 남성, W: 여성)
             max_products: 최대 상품 수
+            context: 사용할 브라우저 컨텍스트 (없으면 작업 전용 컨텍스트 생성 후 종료)
 
         Returns:
             상품 ID 리스트
         """
+        if not self.use_browser:
+            product_ids = await self.api.get_recommend_products(gender_filter, max_products)
+            if product_ids:
+                return product_ids
+            logger.warning("추천 API에서 상품을 찾지 못해 브라우저로 다시 시도합니다.")
+
+        owned_context = context is None
+        if owned_context:
+            context = await self.pool.new_context()
+        page = await self._new_page(context)
+
         try:
             url = f"{Config.RECOMMEND_URL}?gf={gender_filter}"
             logger.info(f"추천 페이지 접속: {url}")
 
-            # 페이지 이동 및 네트워크 대기
-            self.page.goto(url, wait_until='networkidle')
-            self.page.wait_for_timeout(3000)
+            # 페이지 이동 및 상품 링크 렌더링 대기
+            await self._goto(page, url)
+            await self._wait_for_products(page)
 
             # 스크롤하여 더 많은 상품 로딩
-            self._scroll_to_load_products()
+            await self._scroll_to_load_products(page, max_products)
 
             # 상품 ID 추출
-            product_ids = self._extract_product_ids(max_products)
+            product_ids = await self._extract_product_ids(page, max_products)
 
             logger.info(f"추천 페이지에서 {len(product_ids)}개 상품 발견")
             return product_ids
@@ -144,24 +210,58 @@ class BrandCrawler:
             logger.error(f"추천 페이지 크롤링 실패: {e}")
             return []
 
-    def _extract_product_ids(self, max_products: Optional[int] = None) -> List[str]:
+        finally:
+            await page.close()
+            if owned_context:
+                await context.close()
+
+    async def _goto(self, page: Page, url: str):
+        """호스트별 속도 제한을 지켜 페이지 이동 (429 응답 시 해당 호스트 감속)"""
+        await self.rate_limiter.acquire(url)
+        response = await page.goto(url, wait_until='domcontentloaded')
+        if response is not None and response.status == 429:
+            self.rate_limiter.slow_down(url)
+
+    @staticmethod
+    async def _new_page(context: BrowserContext) -> Page:
+        """불필요한 리소스 요청을 차단한 페이지 발급"""
+        page = await context.new_page()
+        await page.route("**/*", _block_heavy_resources)
+        return page
+
+    @staticmethod
+    async def _wait_for_products(page: Page):
+        """상품 링크가 렌더링될 때까지 대기"""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        try:
+            await page.wait_for_selector(PRODUCT_LINK_SELECTOR, timeout=ELEMENT_WAIT_TIMEOUT)
+        except PlaywrightTimeoutError:
+            logger.warning("상품 링크가 제한 시간 내에 로딩되지 않았습니다.")
+
+    async def _extract_product_ids(
+        self,
+        page: Page,
+        max_products: Optional[int] = None
+    ) -> List[str]:
         """현재 페이지에서 상품 ID 추출"""
         product_ids = []
+        seen = set()
 
         try:
-            # 페이지 HTML 가져오기
-            html_content = self.page.content()
-            soup = BeautifulSoup(html_content, 'lxml')
+            # 상품 링크 href를 브라우저 안에서 한 번에 수집 (DOM 직렬화/파싱 생략)
+            hrefs = await page.eval_on_selector_all(
+                PRODUCT_LINK_SELECTOR,
+                'els => els.map(a => a.getAttribute("href") || "")'
+            )
 
             # 상품 링크에서 ID 추출
-            product_links = soup.select('a[href*="/products/"]')
-
-            for link in product_links:
-                href = link.get('href', '')
-                match = re.search(r'/products/(\d+)', href)
+            for href in hrefs:
+                match = PRODUCT_ID_RE.search(href)
                 if match:
                     product_id = match.group(1)
-                    if product_id not in product_ids:
+                    if product_id not in seen:
+                        seen.add(product_id)
                         product_ids.append(product_id)
 
                         if max_products and len(product_ids) >= max_products:
@@ -172,26 +272,55 @@ class BrandCrawler:
 
         return product_ids
 
-    def _scroll_to_load_products(self, scroll_count: int = 5):
-        """페이지 스크롤하여 상품 로딩"""
+    async def _scroll_to_load_products(
+        self,
+        page: Page,
+        max_products: Optional[int] = None,
+        max_scrolls: int = 20
+    ):
+        """
+        페이지 스크롤하여 상품 로딩
+
+        상품 수가 max_products에 도달하거나 스크롤해도 더 늘지 않으면 중단합니다.
+        """
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
         try:
-            for i in range(scroll_count):
-                # 페이지 하단으로 스크롤
-                self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                self.page.wait_for_timeout(2000)
+            count = await page.evaluate(COUNT_PRODUCTS_JS, PRODUCT_LINK_SELECTOR)
 
-                logger.info(f"스크롤 {i + 1}/{scroll_count}")
+            for i in range(max_scrolls):
+                if max_products and count >= max_products:
+                    break
+
+                # 페이지 하단으로 스크롤 후 새 상품이 추가될 때까지 대기
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                try:
+                    await page.wait_for_function(
+                        f'([sel, prev]) => ({COUNT_PRODUCTS_JS})(sel) > prev',
+                        arg=[PRODUCT_LINK_SELECTOR, count],
+                        timeout=ELEMENT_WAIT_TIMEOUT
+                    )
+                except PlaywrightTimeoutError:
+                    logger.info("더 이상 로딩되는 상품이 없습니다.")
+                    break
+
+                count = await page.evaluate(COUNT_PRODUCTS_JS, PRODUCT_LINK_SELECTOR)
+                logger.info(f"스크롤 {i + 1}/{max_scrolls}: 상품 {count}개")
 
         except Exception as e:
             logger.warning(f"스크롤 중 오류: {e}")
 
-    def get_brand_products_multi(
+    async def get_brand_products_multi(
         self,
         brand_names: List[str],
         max_products_per_brand: Optional[int] = None
     ) -> Dict[str, List[str]]:
         """
-        여러 브랜드의 상품 목록 추출
+        여러 브랜드의 상품 목록을 동시에 추출
+
+        브라우저 경로에서는 브랜드마다 별도 컨텍스트(쿠키/스토리지 격리)를 사용합니다.
+        동시 실행 수는 Config.MAX_CONCURRENCY로 제한되며,
+        요청 간격은 토큰 버킷(Config.REQS_PER_SEC)으로 조절합니다.
 
         Args:
             brand_names: 브랜드명 리스트
@@ -200,23 +329,15 @@ class BrandCrawler:
         Returns:
             {브랜드명: [상품ID 리스트]} 딕셔너리
         """
-        results = {}
-
-        for brand_name in brand_names:
-            product_ids = self.search_brand_products(brand_name, max_products_per_brand)
-            results[brand_name] = product_ids
-
-            # 다음 브랜드 검색 전 대기
-            time.sleep(Config.DELAY_BETWEEN_REQUESTS)
-
-        return results
-
-    def close(self):
-        """브라우저 종료"""
-        if self.page:
-            self.page.close()
-        if self.browser:
-            self.browser.close()
-        if self.playwright:
-            self.playwright.stop()
-        logger.info("Playwright 브라우저 종료")
+        semaphore = asyncio.Semaphore(Config.MAX_CONCURRENCY)
+
+        async def fetch(brand_name: str) -> List[str]:
+            async with semaphore:
+                return await self.search_brand_products(brand_name, max_products_per_brand)
+
+        product_id_lists = await asyncio.gather(*[fetch(b) for b in brand_names])
+        return dict(zip(brand_names, product_id_lists))
+
+    async def close(self):
+        """직접 생성한 브라우저 풀 및 API 클라이언트 종료"""
+        await self._exit_stack.aclose()
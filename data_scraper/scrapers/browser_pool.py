@@ -0,0 +1,181 @@
+"""
+공유 Playwright 브라우저 풀
+
+Chromium 프로세스 하나를 띄워두고 작업마다 컨텍스트만 새로 발급합니다.
+브라우저는 첫 컨텍스트가 필요해질 때 실행되므로, 브라우저를 쓰지 않는 실행에서는 비용이 없습니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional, Pattern, Set
+
+from ..utils.logger import setup_logger
+from ..utils.config import Config
+from ..utils.json_utils import dumps_line
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Playwright, Route
+
+logger = setup_logger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# 스크래핑에 필요 없는 Chromium 기능 비활성화
+LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-extensions',
+    '--disable-default-apps',
+    '--disable-features=IsolateOrigins,site-per-process',
+]
+
+# 렌더러에서 이미지 디코딩 자체를 끄는 옵션
+# 크롤러와 상세 스크래퍼 모두 이미지 URL은 DOM 속성에서 읽고 파일은 HTTP로 따로 받으므로 켜둘 필요가 없음
+NO_IMAGES_ARG = '--blink-settings=imagesEnabled=false'
+
+
+def resource_blocker(
+    resource_types: Set[str],
+    url_pattern: Optional[Pattern] = None
+) -> Callable[[Route], Awaitable[None]]:
+    """
+    page.route / context.route용 요청 차단 핸들러 생성
+
+    Args:
+        resource_types: 차단할 리소스 타입 (image, font, stylesheet 등)
+        url_pattern: 추가로 차단할 URL 정규식 (분석/트래킹 스크립트 등)
+
+    Returns:
+        route 핸들러
+    """
+    async def handler(route: Route):
+        request = route.request
+        if request.resource_type in resource_types or (
+            url_pattern is not None and url_pattern.search(request.url)
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    return handler
+
+
+def resource_allowlist(resource_types: Set[str]) -> Callable[[Route], Awaitable[None]]:
+    """
+    page.route / context.route용 허용 목록 핸들러 생성
+
+    Args:
+        resource_types: 통과시킬 리소스 타입 (document, script, xhr 등). 나머지는 모두 차단
+
+    Returns:
+        route 핸들러
+    """
+    async def handler(route: Route):
+        if route.request.resource_type in resource_types:
+            await route.continue_()
+        else:
+            await route.abort()
+
+    return handler
+
+
+class BrowserPool:
+    """공유 브라우저 풀 (Playwright)"""
+
+    def __init__(
+        self,
+        headless: bool = True,
+        block_images: bool = False,
+        persist_state: bool = True
+    ):
+        """
+        Args:
+            headless: 헤드리스 모드 여부
+            block_images: 이미지 로딩/디코딩 비활성화 여부
+            persist_state: 쿠키/로컬 스토리지를 파일로 저장해 다음 실행에서 재사용할지 여부
+        """
+        self.headless = headless
+        self.block_images = block_images
+        self.persist_state = persist_state
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self._start_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "BrowserPool":
+        # 브라우저는 new_context() 첫 호출 시 실행
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def start(self):
+        """브라우저 실행 (이미 실행 중이면 무시, 동시 호출 시 한 번만 실행)"""
+        async with self._start_lock:
+            if self.browser:
+                return
+
+            # playwright는 브라우저가 실제로 필요할 때만 import
+            from playwright.async_api import async_playwright
+
+            self.playwright = await async_playwright().start()
+
+            args = LAUNCH_ARGS + [NO_IMAGES_ARG] if self.block_images else LAUNCH_ARGS
+
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                args=args
+            )
+
+            logger.info("Playwright 브라우저 초기화 완료")
+
+    async def new_context(self) -> BrowserContext:
+        """새 브라우저 컨텍스트 생성 (저장된 스토리지 상태가 있으면 불러옴)"""
+        await self.start()
+
+        state_path = Config.STORAGE_STATE_PATH
+        storage_state = str(state_path) if self.persist_state and state_path.exists() else None
+
+        context = await self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent=USER_AGENT,
+            storage_state=storage_state
+        )
+
+        # 기본 타임아웃 설정
+        context.set_default_timeout(Config.PAGE_LOAD_TIMEOUT * 1000)
+        return context
+
+    async def save_state(self, context: BrowserContext):
+        """
+        컨텍스트의 쿠키/로컬 스토리지를 저장 (다음 실행에서 쿠키 워밍업 생략)
+
+        여러 프로세스가 동시에 저장해도 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체합니다.
+        """
+        if not self.persist_state:
+            return
+
+        state_path = Config.STORAGE_STATE_PATH
+        tmp_path = state_path.with_name(f"{state_path.name}.{os.getpid()}.tmp")
+
+        try:
+            state = await context.storage_state()
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(dumps_line(state))
+            os.replace(tmp_path, state_path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"브라우저 스토리지 상태 저장 실패: {e}")
+
+    async def close(self):
+        """브라우저 종료"""
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+            logger.info("Playwright 브라우저 종료")
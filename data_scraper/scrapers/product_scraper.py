@@ -1,67 +1,124 @@
 """
-상품 상세 페이지 스크래퍼 (Playwright 기반)
+상품 상세 페이지 스크래퍼 (HTML 직접 요청 우선, Playwright 폴백)
 """
-import time
-from playwright.sync_api import sync_playwright, Browser, Page, Playwright
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AsyncExitStack
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+from typing import TYPE_CHECKING, Dict, List, Optional
 from pathlib import Path
-import json
 
 from ..utils.logger import setup_logger
 from ..utils.config import Config
 from ..utils.image_downloader import ImageDownloader
+from ..utils.page_cache import PageCache
+from ..utils.rate_limiter import HostRateLimiter
+from .browser_pool import BrowserPool, resource_allowlist
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page
 
 logger = setup_logger(__name__)
 
+# 브라우저 없이 상품 HTML을 직접 요청할 때 사용하는 헤더
+HTML_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml',
+    'Accept-Language': 'ko-KR,ko;q=0.9',
+}
+
+# HTML/속성만 읽으므로 문서와 데이터 로딩용 요청만 허용
+# (이미지·폰트·CSS·미디어 등은 차단해도 img src 속성은 그대로 남음)
+ALLOWED_RESOURCE_TYPES = {'document', 'script', 'xhr', 'fetch'}
+
+# 상품 정보 필드별 셀렉터 (첫 번째 요소의 텍스트)
+PRODUCT_TITLE_SELECTOR = 'span.product_title'
+PRODUCT_FIELD_SELECTORS = {
+    'product_name': PRODUCT_TITLE_SELECTOR,
+    'brand': 'p.product_article a',
+    'price': 'span.product_price span',
+    'discount_rate': 'span.product_article_price span.product_discount',
+    'description': 'p.product_summary',
+}
+CATEGORY_SELECTOR = 'p.product_article span'
+
+# 이미지 셀렉터 (메인 / 썸네일 / 상세)
+MAIN_IMAGE_SELECTOR = 'div.product-img img'
+THUMB_IMAGE_SELECTOR = 'ul.product_thumb img'
+DETAIL_IMAGE_SELECTOR = 'div.detail_info img'
+
+# 렌더링 대기 타임아웃 (ms)
+TITLE_WAIT_TIMEOUT = 5000
+DETAIL_IMAGE_WAIT_TIMEOUT = 3000
+
 
 class ProductScraper:
-    """상품 상세 정보 스크래퍼 (Playwright)"""
+    """상품 상세 정보 스크래퍼 (HTML 직접 요청 우선, Playwright 폴백)"""
 
-    def __init__(self, headless: bool = True):
+    def __init__(
+        self,
+        headless: bool = True,
+        pool: Optional[BrowserPool] = None,
+        static_first: bool = True,
+        use_cache: bool = True,
+        reqs_per_sec: Optional[float] = None
+    ):
         """
         Args:
             headless: 헤드리스 모드 여부
+            pool: 공유 브라우저 풀 (없으면 직접 생성)
+            static_first: 브라우저 렌더링 전에 HTML 직접 요청을 먼저 시도할지 여부
+            use_cache: 최근에 받은 상품 페이지 HTML을 캐시에서 재사용할지 여부
+            reqs_per_sec: 호스트당 초당 페이지 요청 수 (기본: Config.REQS_PER_SEC)
         """
         self.headless = headless
-        self.playwright: Optional[Playwright] = None
-        self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
+        self.pool = pool
+        self.static_first = static_first
+        self.page_cache = (
+            PageCache(Config.PAGE_CACHE_PATH, Config.PAGE_CACHE_EXPIRE) if use_cache else None
+        )
+        self.context: Optional[BrowserContext] = None
+        self.rate_limiter = HostRateLimiter(reqs_per_sec or Config.REQS_PER_SEC)
         self.image_downloader = ImageDownloader(Config.IMAGE_DOWNLOAD_PATH)
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self._context_lock = asyncio.Lock()
+        self._exit_stack = AsyncExitStack()
 
-    def __enter__(self):
-        self._init_browser()
+    async def __aenter__(self):
+        self.http_client = await self._exit_stack.enter_async_context(
+            ImageDownloader.create_client()
+        )
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
-
-    def _init_browser(self):
-        """Playwright 브라우저 초기화"""
-        self.playwright = sync_playwright().start()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
 
-        self.browser = self.playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-            ]
-        )
-
-        # 새 컨텍스트 생성 (브라우저 세션)
-        context = self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
+    async def _init_browser(self) -> BrowserContext:
+        """
+        스크래퍼 전용 브라우저 컨텍스트 준비 (브라우저 경로가 처음 필요할 때 한 번만)
 
-        self.page = context.new_page()
+        HTML 직접 요청이나 캐시로 모든 상품을 처리하면 브라우저는 실행되지 않습니다.
+        컨텍스트는 한 번만 만들고, 페이지는 상품마다 새로 발급합니다.
+        """
+        async with self._context_lock:
+            if self.context is None:
+                if self.pool is None:
+                    self.pool = await self._exit_stack.enter_async_context(
+                        BrowserPool(headless=self.headless, block_images=True)
+                    )
 
-        # 기본 타임아웃 설정
-        self.page.set_default_timeout(Config.PAGE_LOAD_TIMEOUT * 1000)
+                context = await self.pool.new_context()
+                await context.route("**/*", resource_allowlist(ALLOWED_RESOURCE_TYPES))
+                self.context = context
 
-        logger.info("Playwright 브라우저 초기화 완료")
+        return self.context
 
-    def scrape_product(
+    async def scrape_product(
         self,
         product_id: str,
         download_images: bool = True
@@ -69,6 +126,9 @@ class ProductScraper:
         """
         상품 상세 정보 스크래핑
 
+        서버 렌더링 HTML을 먼저 직접 요청하고, 필수 정보가 없을 때만 브라우저로 렌더링합니다.
+        브라우저 경로는 호출마다 새 페이지를 열기 때문에 여러 상품을 동시에 스크래핑할 수 있습니다.
+
         Args:
             product_id: 상품 ID
             download_images: 이미지 다운로드 여부
@@ -79,183 +139,365 @@ class ProductScraper:
         url = f"{Config.BASE_URL}/products/{product_id}"
 
         try:
-            logger.info(f"상품 페이지 접속: {url}")
+            logger.info("상품 페이지 접속: %s", url)
 
-            # 페이지 이동 및 로딩 완료 대기
-            self.page.goto(url, wait_until='networkidle')
-
-            # 추가 대기 (동적 콘텐츠 로딩)
-            self.page.wait_for_timeout(2000)
-
-            # 상품 정보 추출
-            product_data = self._extract_product_info(product_id)
-
-            # 이미지 추출
-            image_urls = self._extract_image_urls()
-            product_data['image_urls'] = image_urls
-            product_data['image_count'] = len(image_urls)
+            product_data = self._load_cached(url, product_id)
+            if product_data is None and self.static_first:
+                product_data = await self._scrape_static(url, product_id)
+            if product_data is None:
+                product_data = await self._scrape_with_browser(url, product_id)
 
             # 이미지 다운로드
+            image_urls = product_data['image_urls']
             if download_images and image_urls:
-                downloaded_paths = self.image_downloader.download_images(
+                downloaded_paths = await self.image_downloader.download_images_async(
                     image_urls,
                     product_id,
-                    max_images=Config.MAX_IMAGES_PER_PRODUCT
+                    max_images=Config.MAX_IMAGES_PER_PRODUCT,
+                    client=self.http_client
                 )
                 product_data['downloaded_images'] = [str(p) for p in downloaded_paths]
 
-            logger.info(f"상품 {product_id} 스크래핑 완료")
+            logger.info("상품 %s 스크래핑 완료", product_id)
             return product_data
 
         except Exception as e:
-            logger.error(f"상품 {product_id} 스크래핑 실패: {e}")
+            logger.error("상품 %s 스크래핑 실패: %s", product_id, e)
             return None
 
-    def _extract_product_info(self, product_id: str) -> Dict:
-        """상품 기본 정보 추출"""
-        product_data = {
-            'product_id': product_id,
-            'url': self.page.url
-        }
+    def _load_cached(self, url: str, product_id: str) -> Optional[Dict]:
+        """캐시된 페이지 HTML에서 상품 정보 추출 (캐시가 없거나 만료되면 None)"""
+        if self.page_cache is None:
+            return None
 
+        cached = self.page_cache.get(url)
+        if cached is None:
+            return None
+
+        final_url, html = cached
+        logger.info("상품 %s: 캐시된 페이지 사용", product_id)
+        return self._parse_html(html, product_id, final_url)
+
+    def _store_cached(self, url: str, final_url: str, html: str):
+        """상품 정보가 추출된 페이지 HTML만 캐시에 저장"""
+        if self.page_cache is not None:
+            self.page_cache.set(url, final_url, html)
+
+    async def _scrape_static(self, url: str, product_id: str) -> Optional[Dict]:
+        """
+        브라우저 없이 HTML을 직접 받아 상품 정보 추출
+
+        Returns:
+            상품 정보 딕셔너리 (None이면 브라우저로 재시도: 상품명이 없는 정상 응답,
+            연결/타임아웃 오류, 봇 차단(403) 또는 서버 오류(5xx))
+
+        Raises:
+            httpx.HTTPStatusError: 그 밖의 2xx가 아닌 응답 (404/429 등은 브라우저로 재시도하지 않음)
+        """
+        await self.rate_limiter.acquire(url)
         try:
-            # 페이지 HTML 가져오기
-            html_content = self.page.content()
-            soup = BeautifulSoup(html_content, 'lxml')
+            response = await self.http_client.get(
+                url,
+                headers=HTML_HEADERS,
+                follow_redirects=True
+            )
+        except httpx.TransportError as e:
+            logger.info("상품 %s: HTML 요청 실패 (%s), 브라우저로 재시도", product_id, e)
+            return None
 
-            # 상품명
-            try:
-                product_name = soup.select_one('span.product_title')
-                if product_name:
-                    product_data['product_name'] = product_name.get_text(strip=True)
-            except:
-                pass
+        if response.status_code == 429:
+            self.rate_limiter.slow_down(url)
+        elif response.status_code == 403 or response.status_code >= 500:
+            logger.info(
+                "상품 %s: HTML 요청이 %d 응답, 브라우저로 재시도",
+                product_id, response.status_code
+            )
+            return None
+        response.raise_for_status()
 
-            # 브랜드명
-            try:
-                brand = soup.select_one('p.product_article a')
-                if brand:
-                    product_data['brand'] = brand.get_text(strip=True)
-            except:
-                pass
+        product_data = self._parse_html(response.text, product_id, str(response.url))
+        if product_data is None:
+            logger.info("상품 %s: 서버 HTML에 상품 정보가 없어 브라우저로 재시도", product_id)
+            return None
 
-            # 가격
-            try:
-                price = soup.select_one('span.product_price span')
-                if price:
-                    product_data['price'] = price.get_text(strip=True)
-            except:
-                pass
+        self._store_cached(url, str(response.url), response.text)
+        return product_data
 
-            # 할인율
-            try:
-                discount = soup.select_one('span.product_article_price span.product_discount')
-                if discount:
-                    product_data['discount_rate'] = discount.get_text(strip=True)
-            except:
-                pass
+    def _parse_html(self, html: str, product_id: str, url: str) -> Optional[Dict]:
+        """
+        페이지 HTML에서 상품 정보와 이미지 URL 추출
 
-            # 상품 설명
-            try:
-                description = soup.select_one('p.product_summary')
-                if description:
-                    product_data['description'] = description.get_text(strip=True)
-            except:
-                pass
+        Returns:
+            상품 정보 딕셔너리 (상품명이 없으면 None)
+        """
+        tree = LexborHTMLParser(html)
+        product_data = self._parse_product_info(tree, product_id, url)
+        if 'product_name' not in product_data:
+            return None
+
+        image_urls = self._build_image_urls(
+            [img.attributes.get('src') or '' for img in tree.css(MAIN_IMAGE_SELECTOR)],
+            [img.attributes.get('src') or '' for img in tree.css(THUMB_IMAGE_SELECTOR)],
+            [img.attributes.get('src') or '' for img in tree.css(DETAIL_IMAGE_SELECTOR)]
+        )
+        product_data['image_urls'] = image_urls
+        product_data['image_count'] = len(image_urls)
+
+        return product_data
+
+    async def _scrape_with_browser(self, url: str, product_id: str) -> Dict:
+        """Playwright로 페이지를 렌더링하여 상품 정보 추출"""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-            # 카테고리
+        context = await self._init_browser()
+        page = await context.new_page()
+
+        try:
+            # 페이지 이동 후 상품명이 렌더링될 때까지만 대기 (networkidle/고정 대기 생략)
+            await self.rate_limiter.acquire(url)
+            response = await page.goto(url, wait_until='domcontentloaded')
+            if response is not None and response.status == 429:
+                self.rate_limiter.slow_down(url)
             try:
-                category_elements = soup.select('p.product_article span')
-                categories = [cat.get_text(strip=True) for cat in category_elements]
-                if categories:
-                    product_data['categories'] = categories
-            except:
-                pass
+                await page.wait_for_selector(PRODUCT_TITLE_SELECTOR, timeout=TITLE_WAIT_TIMEOUT)
+            except PlaywrightTimeoutError:
+                logger.warning("상품 %s: 상품명이 제한 시간 내에 렌더링되지 않았습니다.", product_id)
+
+            # 상품 정보 추출
+            product_data = await self._extract_product_info(page, product_id)
+
+            # 이미지 추출
+            image_urls = await self._extract_image_urls(page)
+            product_data['image_urls'] = image_urls
+            product_data['image_count'] = len(image_urls)
+
+            # 렌더링 결과(상세 이미지 로딩 후)를 캐시해 다음 실행에서는 브라우저를 건너뜀
+            if 'product_name' in product_data:
+                self._store_cached(url, page.url, await page.content())
+
+            return product_data
 
+        finally:
+            await page.close()
+
+    async def _extract_product_info(self, page: Page, product_id: str) -> Dict:
+        """렌더링된 페이지에서 상품 기본 정보 추출"""
+        try:
+            # 페이지 HTML 가져오기
+            html_content = await page.content()
+            tree = LexborHTMLParser(html_content)
         except Exception as e:
-            logger.warning(f"상품 정보 추출 중 오류: {e}")
+            logger.warning("상품 정보 추출 중 오류: %s", e)
+            return {'product_id': product_id, 'url': page.url}
+
+        return self._parse_product_info(tree, product_id, page.url)
+
+    @staticmethod
+    def _parse_product_info(tree: LexborHTMLParser, product_id: str, url: str) -> Dict:
+        """파싱된 HTML에서 상품 기본 정보 추출"""
+        product_data = {
+            'product_id': product_id,
+            'url': url
+        }
+
+        # 없는 셀렉터는 None을 반환하므로 예외 처리 불필요
+        for field, selector in PRODUCT_FIELD_SELECTORS.items():
+            node = tree.css_first(selector)
+            if node is not None:
+                product_data[field] = node.text(strip=True)
+
+        categories = [node.text(strip=True) for node in tree.css(CATEGORY_SELECTOR)]
+        if categories:
+            product_data['categories'] = categories
 
         return product_data
 
-    def _extract_image_urls(self) -> List[str]:
-        """상품 이미지 URL 추출"""
+    async def _extract_image_urls(self, page: Page) -> List[str]:
+        """렌더링된 페이지에서 상품 이미지 URL 추출"""
+        from playwright.async_api import Error as PlaywrightError
+
         image_urls = []
 
         try:
-            # 메인 상품 이미지
-            main_images = self.page.query_selector_all('div.product-img img')
-            for img in main_images:
-                src = img.get_attribute('src')
-                if src and src.startswith('http'):
-                    image_urls.append(src)
-
-            # 썸네일 이미지에서 원본 URL 추출
-            thumbnails = self.page.query_selector_all('ul.product_thumb img')
-            for thumb in thumbnails:
-                src = thumb.get_attribute('src')
-                if src and src.startswith('http'):
-                    # 썸네일을 원본 이미지로 변환
-                    original_url = src.replace('_125.', '_500.')
-                    if original_url not in image_urls:
-                        image_urls.append(original_url)
+            main_srcs = await self._get_image_srcs(page, MAIN_IMAGE_SELECTOR)
+            thumb_srcs = await self._get_image_srcs(page, THUMB_IMAGE_SELECTOR)
 
             # 상세 이미지 (스크롤 다운하여 로딩)
+            detail_srcs = []
             try:
-                # 페이지 하단으로 스크롤
-                self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                self.page.wait_for_timeout(2000)
+                # 페이지 하단으로 스크롤 후 상세 이미지 태그가 붙을 때까지 대기
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await page.wait_for_selector(
+                    DETAIL_IMAGE_SELECTOR,
+                    state='attached',
+                    timeout=DETAIL_IMAGE_WAIT_TIMEOUT
+                )
 
-                detail_images = self.page.query_selector_all('div.detail_info img')
-                for img in detail_images:
-                    src = img.get_attribute('src')
-                    if src and src.startswith('http') and src not in image_urls:
-                        image_urls.append(src)
-            except:
-                pass
+                detail_srcs = await self._get_image_srcs(page, DETAIL_IMAGE_SELECTOR)
+            except PlaywrightError:
+                # 대기 시간 초과 포함 (상세 이미지가 없는 상품)
+                logger.info("상세 이미지가 없습니다.")
 
-            logger.info(f"추출된 이미지 URL 개수: {len(image_urls)}")
+            image_urls = self._build_image_urls(main_srcs, thumb_srcs, detail_srcs)
+            logger.info("추출된 이미지 URL 개수: %d", len(image_urls))
 
         except Exception as e:
-            logger.error(f"이미지 URL 추출 실패: {e}")
+            logger.error("이미지 URL 추출 실패: %s", e)
+
+        return image_urls
+
+    @staticmethod
+    async def _get_image_srcs(page: Page, selector: str) -> List[str]:
+        """셀렉터에 해당하는 img 태그의 src 목록 (요소별 왕복 없이 브라우저 안에서 한 번에 수집)"""
+        return await page.eval_on_selector_all(
+            selector,
+            'els => els.map(img => img.getAttribute("src") || "")'
+        )
+
+    @staticmethod
+    def _build_image_urls(
+        main_srcs: List[str],
+        thumb_srcs: List[str],
+        detail_srcs: List[str]
+    ) -> List[str]:
+        """메인/썸네일/상세 이미지 src를 중복 없는 원본 이미지 URL 목록으로 정리"""
+        image_urls = []
+        seen = set()
+
+        # 썸네일은 원본 이미지 URL로 변환
+        candidates = (
+            main_srcs
+            + [src.replace('_125.', '_500.') for src in thumb_srcs]
+            + detail_srcs
+        )
+        for src in candidates:
+            if src.startswith('http') and src not in seen:
+                seen.add(src)
+                image_urls.append(src)
 
         return image_urls
 
-    def scrape_products(
+    async def scrape_products(
         self,
         product_ids: List[str],
-        delay: int = 2
+        delay: float = 0,
+        concurrency: Optional[int] = None
     ) -> List[Dict]:
         """
-        여러 상품 스크래핑
+        여러 상품 동시 스크래핑
+
+        요청 간격은 호스트별 토큰 버킷(Config.REQS_PER_SEC)이 조절하며,
+        429 응답을 받으면 해당 호스트의 속도를 자동으로 낮춥니다.
 
         Args:
             product_ids: 상품 ID 리스트
-            delay: 요청 간 대기 시간 (초)
+            delay: 작업마다 추가로 쉴 평균 시간 (초, ±50% 무작위 지터 적용, 기본: 없음)
+            concurrency: 동시 스크래핑 수 (기본: Config.MAX_CONCURRENCY)
 
         Returns:
-            상품 정보 리스트
+            상품 정보 리스트 (입력 순서 유지)
         """
-        products = []
-
-        for idx, product_id in enumerate(product_ids):
-            logger.info(f"진행률: {idx + 1}/{len(product_ids)}")
-
-            product_data = self.scrape_product(product_id)
-            if product_data:
-                products.append(product_data)
+        semaphore = asyncio.Semaphore(concurrency or Config.MAX_CONCURRENCY)
+        total = len(product_ids)
+
+        async def bounded_scrape(idx: int, product_id: str) -> Optional[Dict]:
+            async with semaphore:
+                logger.info("진행률: %d/%d", idx, total)
+                product_data = await self.scrape_product(product_id)
+
+                # 추가 대기를 지정한 경우에만 지터를 준 대기
+                if delay:
+                    await asyncio.sleep(random.uniform(delay * 0.5, delay * 1.5))
+                return product_data
+
+        results = await asyncio.gather(
+            *[bounded_scrape(idx, pid) for idx, pid in enumerate(product_ids, 1)],
+            return_exceptions=True
+        )
 
-            # 마지막 상품이 아니면 대기
-            if idx < len(product_ids) - 1:
-                time.sleep(delay)
+        products = []
+        for product_id, result in zip(product_ids, results):
+            if isinstance(result, BaseException):
+                logger.error("상품 %s 스크래핑 실패: %s", product_id, result)
+            elif result:
+                products.append(result)
 
         return products
 
-    def close(self):
-        """브라우저 종료"""
-        if self.page:
-            self.page.close()
-        if self.browser:
-            self.browser.close()
-        if self.playwright:
-            self.playwright.stop()
-        logger.info("Playwright 브라우저 종료")
+    async def close(self):
+        """컨텍스트, 이미지 다운로더, 페이지 캐시 및 직접 생성한 브라우저 풀 종료"""
+        if self.page_cache:
+            self.page_cache.close()
+            self.page_cache = None
+        self.image_downloader.close()
+        if self.context:
+            await self.pool.save_state(self.context)
+            await self.context.close()
+            self.context = None
+        await self._exit_stack.aclose()
+
+
+def _scrape_shard(
+    product_ids: List[str],
+    headless: bool,
+    delay: float,
+    concurrency: int,
+    reqs_per_sec: float
+) -> List[Dict]:
+    """프로세스 풀 워커: 자체 브라우저를 띄워 상품 묶음 하나를 스크래핑"""
+    async def run() -> List[Dict]:
+        async with ProductScraper(headless=headless, reqs_per_sec=reqs_per_sec) as scraper:
+            return await scraper.scrape_products(product_ids, delay=delay, concurrency=concurrency)
+
+    return asyncio.run(run())
+
+
+def scrape_products_parallel(
+    product_ids: List[str],
+    workers: Optional[int] = None,
+    headless: bool = True,
+    delay: float = 0
+) -> List[Dict]:
+    """
+    여러 프로세스로 나눠 대량의 상품 스크래핑
+
+    상품 ID를 workers개 묶음으로 나눠 프로세스마다 브라우저와 이벤트 루프를 따로 실행합니다.
+    HTML 파싱처럼 CPU를 쓰는 구간이 GIL 없이 병렬로 처리됩니다.
+    동시 실행 수(Config.MAX_CONCURRENCY)와 요청 속도(Config.REQS_PER_SEC)는
+    전체 합계가 단일 프로세스와 같도록 워커 수로 나눠 적용하며,
+    프로세스마다 최소 1개는 동시에 처리해야 하므로 워커 수는 Config.MAX_CONCURRENCY를 넘지 않습니다.
+
+    Args:
+        product_ids: 상품 ID 리스트
+        workers: 프로세스 수 (기본: CPU 코어 수, 최대 Config.MAX_CONCURRENCY)
+        headless: 헤드리스 모드 여부
+        delay: 작업마다 추가로 쉴 평균 시간 (초)
+
+    Returns:
+        상품 정보 리스트 (입력 순서 유지)
+    """
+    if not product_ids:
+        return []
+
+    workers = min(workers or os.cpu_count() or 1, Config.MAX_CONCURRENCY, len(product_ids))
+    shard_size = math.ceil(len(product_ids) / workers)
+    shards = [
+        product_ids[i:i + shard_size]
+        for i in range(0, len(product_ids), shard_size)
+    ]
+
+    logger.info("%d개 상품을 %d개 프로세스로 나눠 스크래핑", len(product_ids), len(shards))
+
+    concurrency = max(1, Config.MAX_CONCURRENCY // len(shards))
+    reqs_per_sec = Config.REQS_PER_SEC / len(shards)
+
+    with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+        results = executor.map(
+            _scrape_shard,
+            shards,
+            [headless] * len(shards),
+            [delay] * len(shards),
+            [concurrency] * len(shards),
+            [reqs_per_sec] * len(shards)
+        )
+        return [product for shard_products in results for product in shard_products]
@@ -0,0 +1,58 @@
+"""
+ImageDownloader 중복 방지 인덱스 테스트
+"""
+import hashlib
+import tempfile
+import unittest
+from pathlib import Path
+
+from data_scraper.utils.image_downloader import ImageDownloader
+
+IMAGE_A = b'\xff\xd8\xff' + b'A' * 64
+IMAGE_B = b'\xff\xd8\xff' + b'B' * 64
+URL_A = 'https://image.msscdn.net/a.jpg'
+URL_B = 'https://image.msscdn.net/b.jpg'
+
+
+class DedupIndexTest(unittest.TestCase):
+    """같은 경로를 새 이미지로 덮어쓴 뒤 예전 인덱스가 재사용되지 않는지 확인"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.downloader = ImageDownloader(Path(self.tmp_dir.name))
+
+    def tearDown(self):
+        self.downloader.close()
+        self.tmp_dir.cleanup()
+
+    def _save(self, data: bytes, url: str, product_id: str, image_index: int = 0) -> Path:
+        """다운로드 없이 임시 파일을 써서 저장 과정(_finalize)만 실행"""
+        tmp_path = self.downloader._part_path(product_id, image_index)
+        tmp_path.write_bytes(data)
+        file_path = self.downloader._image_path(product_id, image_index, '.jpg')
+        return self.downloader._finalize(
+            tmp_path, file_path, hashlib.md5(data).hexdigest(), url, validate=False
+        )
+
+    def test_replaced_path_is_not_reused_for_old_image(self):
+        # 상품 1의 0번 이미지를 A로 받았다가 재수집 시 B로 교체
+        self._save(IMAGE_A, URL_A, '1')
+        self._save(IMAGE_B, URL_B, '1')
+
+        # 상품 2: A의 URL로 재사용하면 안 됨 (예전 기록은 이제 B를 가리킴)
+        self.assertIsNone(self.downloader._reuse_downloaded(URL_A, '2', 0))
+
+        # 상품 3: A와 같은 내용을 받아도 B 파일이 연결되면 안 됨
+        path = self._save(IMAGE_A, 'https://image.msscdn.net/a-copy.jpg', '3')
+        self.assertEqual(path.read_bytes(), IMAGE_A)
+
+    def test_same_url_is_reused(self):
+        self._save(IMAGE_A, URL_A, '1')
+
+        path = self.downloader._reuse_downloaded(URL_A, '2', 0)
+        self.assertIsNotNone(path)
+        self.assertEqual(path.read_bytes(), IMAGE_A)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,27 +11,51 @@ load_dotenv()
 class Config:
     """크롤링 설정"""
 
-    # 기본 경로
-    BASE_DIR = Path(__file__).parent.parent
+    # 기본 경로 (모든 경로는 import 시 한 번만 절대 경로로 변환)
+    BASE_DIR = Path(__file__).resolve().parent.parent
     DATA_DIR = BASE_DIR / "data"
     IMAGE_DIR = DATA_DIR / "images"
     CSV_DIR = DATA_DIR / "csv"
+    CACHE_DIR = DATA_DIR / "cache"
 
     # 무신사 URL
     BASE_URL = os.getenv("BASE_URL", "https://www.musinsa.com")
     RECOMMEND_URL = f"{BASE_URL}/main/musinsa/recommend"
 
+    # 무신사 JSON API (브라우저 없이 상품 ID 수집)
+    SEARCH_API_URL = os.getenv(
+        "SEARCH_API_URL",
+        "https://api.musinsa.com/api2/hm/web/v5/pans/search/goods"
+    )
+    RECOMMEND_API_URL = os.getenv(
+        "RECOMMEND_API_URL",
+        "https://api.musinsa.com/api2/hm/web/v5/pans/recommend/goods"
+    )
+
     # 크롤링 설정
     HEADLESS = os.getenv("HEADLESS", "True").lower() == "true"
     PAGE_LOAD_TIMEOUT = int(os.getenv("PAGE_LOAD_TIMEOUT", "30"))
-    IMPLICIT_WAIT = int(os.getenv("IMPLICIT_WAIT", "10"))
 
     # 이미지 다운로드 설정
-    IMAGE_DOWNLOAD_PATH = Path(os.getenv("IMAGE_DOWNLOAD_PATH", str(IMAGE_DIR)))
+    IMAGE_DOWNLOAD_PATH = Path(os.getenv("IMAGE_DOWNLOAD_PATH", str(IMAGE_DIR))).resolve()
     MAX_IMAGES_PER_PRODUCT = int(os.getenv("MAX_IMAGES_PER_PRODUCT", "10"))
 
     # 데이터 저장 설정
-    CSV_OUTPUT_PATH = Path(os.getenv("CSV_OUTPUT_PATH", str(CSV_DIR)))
+    CSV_OUTPUT_PATH = Path(os.getenv("CSV_OUTPUT_PATH", str(CSV_DIR))).resolve()
+
+    # 파일 쓰기 버퍼 크기 (기본 8 KiB 대신 1 MiB로 write 호출 수 절감)
+    WRITE_BUFFER_SIZE = 1 << 20
+
+    # 상품 페이지 HTML 캐시 (재실행/중단 후 재개 시 재요청 생략)
+    PAGE_CACHE_PATH = Path(
+        os.getenv("PAGE_CACHE_PATH", str(CACHE_DIR / "musinsa.sqlite"))
+    ).resolve()
+    PAGE_CACHE_EXPIRE = int(os.getenv("PAGE_CACHE_EXPIRE", "86400"))
+
+    # 브라우저 쿠키/로컬 스토리지 저장 파일 (다음 실행에서 재사용)
+    STORAGE_STATE_PATH = Path(
+        os.getenv("STORAGE_STATE_PATH", str(CACHE_DIR / "storage_state.json"))
+    ).resolve()
 
     # 타겟 브랜드
     TARGET_BRANDS = [
@@ -42,7 +66,10 @@ class Config:
 
     # 크롤링 제한
     MAX_PRODUCTS_PER_BRAND = int(os.getenv("MAX_PRODUCTS_PER_BRAND", "100"))
-    DELAY_BETWEEN_REQUESTS = int(os.getenv("DELAY_BETWEEN_REQUESTS", "2"))
+
+    # 동시성 / 속도 제한
+    MAX_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", "8"))
+    REQS_PER_SEC = float(os.getenv("REQS_PER_SEC", "2"))
 
     @classmethod
     def create_directories(cls):
@@ -1,27 +1,152 @@
 """
 이미지 다운로드 모듈
 """
+import asyncio
+import os
+import shutil
+import sqlite3
+import threading
+import uuid
+import weakref
+from functools import lru_cache
+import aiofiles
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
 from PIL import Image
-from io import BytesIO
 import hashlib
+from .config import Config
 from .logger import setup_logger
 
 logger = setup_logger(__name__)
 
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# 비동기 다운로드: 전체 / 호스트당 동시 연결 수
+MAX_CONNECTIONS = 25
+MAX_CONCURRENCY_PER_HOST = 8
+
+# 스트리밍 다운로드 청크 크기
+CHUNK_SIZE = 64 * 1024
+
+# 동기 다운로드: 연결 풀 크기 및 일시적 오류 재시도 정책
+SESSION_POOL_SIZE = 32
+SESSION_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504]
+)
+
+
+# Content-Type → 확장자
+_CONTENT_TYPE_MAP = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp'
+}
+
+# URL에서 그대로 사용할 수 있는 확장자
+_URL_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+
+
+@lru_cache(maxsize=4096)
+def _extension_from_segment(segment: str) -> Optional[str]:
+    """URL 마지막 경로 조각에서 이미지 확장자 추출 (없으면 None)"""
+    if '.' not in segment:
+        return None
+
+    ext = '.' + segment.split('.')[-1].split('?')[0]
+    return ext if ext.lower() in _URL_IMAGE_EXTENSIONS else None
+
+
+def _sniff_image(head: bytes) -> Optional[str]:
+    """
+    파일 앞부분의 매직 바이트로 이미지 형식 판별 (검증과 확장자 결정을 한 번에 처리)
+
+    Args:
+        head: 파일 앞부분 (12바이트 이상)
+
+    Returns:
+        '.jpg', '.png', '.gif', '.webp' 중 하나 (이미지가 아니면 None)
+    """
+    if head.startswith(b'\xff\xd8\xff'):
+        return '.jpg'
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return '.png'
+    if head.startswith(b'GIF8'):
+        return '.gif'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return '.webp'
+    return None
+
 
 class ImageDownloader:
     """이미지 다운로드 및 저장"""
 
-    def __init__(self, download_path: Path):
+    def __init__(self, download_path: Path, strict_validation: bool = False):
         """
         Args:
             download_path: 이미지 저장 경로
+            strict_validation: 헤더 확인 외에 PIL로 이미지 구조까지 검증할지 여부
         """
-        self.download_path = Path(download_path)
+        self.download_path = (
+            download_path if isinstance(download_path, Path) else Path(download_path)
+        )
+        self.strict_validation = strict_validation
         self.download_path.mkdir(parents=True, exist_ok=True)
+        # 세마포어는 처음 대기한 이벤트 루프에 묶이므로 루프마다 따로 관리
+        # (asyncio.run()을 여러 번 호출해도 같은 다운로더를 재사용할 수 있도록)
+        self._host_semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+
+        # 동기 다운로드용 세션 (같은 CDN 호스트 연결 재사용 + 재시도)
+        adapter = HTTPAdapter(
+            pool_connections=SESSION_POOL_SIZE,
+            pool_maxsize=SESSION_POOL_SIZE,
+            max_retries=SESSION_RETRY
+        )
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # 실행 간 중복 다운로드 방지용 인덱스 (URL → 경로, 내용 해시 → 경로)
+        # 파일 저장은 스레드에서도 실행되므로 연결을 공유하고 락으로 보호
+        self._dedup_lock = threading.Lock()
+        self._dedup_db = sqlite3.connect(
+            str(self.download_path / 'dedup.sqlite3'),
+            check_same_thread=False
+        )
+        self._dedup_db.executescript(
+            "CREATE TABLE IF NOT EXISTS url2path (url TEXT PRIMARY KEY, path TEXT);"
+            "CREATE TABLE IF NOT EXISTS md5set (h TEXT PRIMARY KEY, path TEXT);"
+        )
+
+    @staticmethod
+    def create_client() -> httpx.AsyncClient:
+        """
+        이미지 다운로드용 공유 HTTP 클라이언트 생성
+
+        HTTP/2 멀티플렉싱과 keep-alive로 같은 CDN 호스트에 대한
+        TCP/TLS 연결을 재사용합니다. 사용 후 aclose() 필요.
+        """
+        return httpx.AsyncClient(
+            http2=True,
+            headers=DEFAULT_HEADERS,
+            timeout=30,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_CONNECTIONS
+            ),
+        )
 
     def download_image(
         self,
@@ -43,37 +168,266 @@ class ImageDownloader:
             저장된 이미지 경로 또는 None
         """
         try:
-            # 이미지 다운로드
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            # 이미지 검증
-            if validate:
-                img = Image.open(BytesIO(response.content))
-                img.verify()
-
-            # 파일명 생성
-            file_ext = self._get_image_extension(url, response.headers.get('Content-Type', ''))
-            filename = f"{product_id}_{image_index}{file_ext}"
-            file_path = self.download_path / product_id / filename
-
-            # 디렉토리 생성
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            # 이전에 받은 URL이면 다운로드 생략
+            existing = self._reuse_downloaded(url, product_id, image_index)
+            if existing:
+                return existing
+
+            # 이미지 다운로드 (응답 전체를 메모리에 올리지 않고 청크 단위로 바로 기록)
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+
+                tmp_path = self._part_path(product_id, image_index)
+
+                image_hash = hashlib.md5()
+                received = False
+                sniffed_ext = None
+                try:
+                    with open(tmp_path, 'wb', buffering=Config.WRITE_BUFFER_SIZE) as f:
+                        for chunk in response.iter_content(CHUNK_SIZE):
+                            # 첫 청크의 헤더로 형식 판별
+                            if not received:
+                                received = True
+                                sniffed_ext = _sniff_image(chunk)
+                                if validate and sniffed_ext is None:
+                                    raise ValueError("이미지 형식이 아닌 응답입니다")
+
+                            image_hash.update(chunk)
+                            f.write(chunk)
+
+                    if validate and not received:
+                        raise ValueError("빈 응답입니다")
+
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+
+                file_path = self._image_path(
+                    product_id,
+                    image_index,
+                    sniffed_ext or self._get_image_extension(
+                        url, response.headers.get('Content-Type', '')
+                    )
+                )
+
+            return self._finalize(tmp_path, file_path, image_hash.hexdigest(), url, validate)
+
+        except Exception as e:
+            logger.error("이미지 다운로드 실패 (%s): %s", url, e)
+            return None
+
+    async def download_image_async(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        product_id: str,
+        image_index: int = 0,
+        validate: bool = True
+    ) -> Optional[Path]:
+        """
+        이미지 비동기 다운로드 (공유 클라이언트 사용)
+
+        Args:
+            client: create_client()로 만든 HTTP 클라이언트
+            url: 이미지 URL
+            product_id: 상품 ID
+            image_index: 이미지 인덱스
+            validate: 이미지 검증 여부
+
+        Returns:
+            저장된 이미지 경로 또는 None
+        """
+        host = urlparse(url).netloc
+        loop_semaphores = self._host_semaphores.setdefault(asyncio.get_running_loop(), {})
+        semaphore = loop_semaphores.get(host)
+        if semaphore is None:
+            semaphore = loop_semaphores[host] = asyncio.Semaphore(MAX_CONCURRENCY_PER_HOST)
+
+        try:
+            # 이전에 받은 URL이면 다운로드 생략
+            existing = self._reuse_downloaded(url, product_id, image_index)
+            if existing:
+                return existing
+
+            async with semaphore:
+                async with client.stream('GET', url) as response:
+                    response.raise_for_status()
+
+                    # 확장자는 첫 청크를 받은 뒤에 정해지므로 임시 파일에 먼저 기록
+                    tmp_path = self._part_path(product_id, image_index)
+
+                    # 응답 전체를 메모리에 올리지 않고 청크 단위로 바로 기록
+                    image_hash = hashlib.md5()
+                    received = False
+                    sniffed_ext = None
+                    try:
+                        # 디스크 쓰기는 스레드 풀에서 처리해 다음 청크 수신과 겹치도록 함
+                        async with aiofiles.open(
+                            tmp_path, 'wb', buffering=Config.WRITE_BUFFER_SIZE
+                        ) as f:
+                            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                                # 첫 청크의 헤더로 형식 판별
+                                if not received:
+                                    received = True
+                                    sniffed_ext = _sniff_image(chunk)
+                                    if validate and sniffed_ext is None:
+                                        raise ValueError("이미지 형식이 아닌 응답입니다")
+
+                                image_hash.update(chunk)
+                                await f.write(chunk)
+
+                        if validate and not received:
+                            raise ValueError("빈 응답입니다")
+
+                    except BaseException:
+                        tmp_path.unlink(missing_ok=True)
+                        raise
 
-            # 이미지 저장
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
+                    file_path = self._image_path(
+                        product_id,
+                        image_index,
+                        sniffed_ext or self._get_image_extension(
+                            url, response.headers.get('Content-Type', '')
+                        )
+                    )
 
-            logger.info(f"이미지 다운로드 완료: {file_path}")
-            return file_path
+            # 해시 중복 확인/하드링크/엄격 검증은 이벤트 루프를 막지 않도록 스레드에서 실행
+            return await asyncio.to_thread(
+                self._finalize,
+                tmp_path,
+                file_path,
+                image_hash.hexdigest(),
+                url,
+                validate
+            )
 
         except Exception as e:
-            logger.error(f"이미지 다운로드 실패 ({url}): {e}")
+            logger.error("이미지 다운로드 실패 (%s): %s", url, e)
             return None
 
+    def _image_path(self, product_id: str, image_index: int, file_ext: str) -> Path:
+        """이미지 저장 경로"""
+        return self.download_path / product_id / f"{product_id}_{image_index}{file_ext}"
+
+    def _part_path(self, product_id: str, image_index: int) -> Path:
+        """
+        다운로드 중 임시 파일 생성 (상품별 디렉토리 생성 포함)
+
+        같은 상품이 동시에 수집돼도 서로의 임시 파일을 덮어쓰지 않도록 매번 고유한 이름을 사용합니다.
+        파일 권한은 일반 파일과 같이 umask를 따릅니다 (mkstemp의 0600과 달리).
+        """
+        product_dir = self.download_path / product_id
+        product_dir.mkdir(parents=True, exist_ok=True)
+        while True:
+            tmp_path = product_dir / f"{product_id}_{image_index}_{uuid.uuid4().hex[:8]}.part"
+            try:
+                open(tmp_path, 'xb').close()
+                return tmp_path
+            except FileExistsError:
+                continue
+
+    def _finalize(
+        self,
+        tmp_path: Path,
+        file_path: Path,
+        image_hash: str,
+        url: str,
+        validate: bool
+    ) -> Path:
+        """
+        임시 파일을 최종 경로로 옮기고 중복 방지 인덱스에 기록
+
+        같은 내용의 이미지가 이미 있으면 임시 파일을 버리고 기존 파일을 하드링크합니다.
+        """
+        try:
+            # 엄격 모드에서만 PIL로 구조 검증
+            if validate and self.strict_validation:
+                with Image.open(tmp_path) as img:
+                    img.verify()
+
+            with self._dedup_lock:
+                row = self._dedup_db.execute(
+                    "SELECT path FROM md5set WHERE h = ?", (image_hash,)
+                ).fetchone()
+
+            # 이 경로의 내용이 바뀌므로 예전 내용을 가리키던 인덱스 항목부터 삭제
+            self._forget(file_path)
+
+            if row and Path(row[0]) != file_path and Path(row[0]).exists():
+                tmp_path.unlink()
+                self._link_file(Path(row[0]), file_path)
+            else:
+                # 기존 파일이 다른 상품과 하드링크되어 있어도 내용을 덮어쓰지 않도록 교체
+                os.replace(tmp_path, file_path)
+                self._record('md5set', image_hash, file_path)
+
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        self._record('url2path', url, file_path)
+
+        logger.info("이미지 다운로드 완료: %s", file_path)
+        return file_path
+
+    def _reuse_downloaded(
+        self,
+        url: str,
+        product_id: str,
+        image_index: int
+    ) -> Optional[Path]:
+        """
+        이전 실행에서 같은 URL로 받은 이미지를 이 상품 경로에 연결
+
+        Returns:
+            연결된 이미지 경로 (기록이 없거나 파일이 지워졌으면 None)
+        """
+        with self._dedup_lock:
+            row = self._dedup_db.execute(
+                "SELECT path FROM url2path WHERE url = ?", (url,)
+            ).fetchone()
+
+        if not row or not Path(row[0]).exists():
+            return None
+
+        existing = Path(row[0])
+        file_path = self._image_path(product_id, image_index, existing.suffix)
+        if file_path != existing:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            if not (file_path.exists() and file_path.samefile(existing)):
+                self._forget(file_path)
+            self._link_file(existing, file_path)
+
+        return file_path
+
+    @staticmethod
+    def _link_file(src: Path, dst: Path):
+        """src를 dst로 하드링크 (지원하지 않는 파일 시스템이면 복사)"""
+        if dst.exists():
+            if dst.samefile(src):
+                return
+            dst.unlink()
+
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+
+    def _forget(self, path: Path):
+        """덮어쓸 경로를 가리키는 중복 방지 인덱스 항목 삭제 (다른 URL/내용에 잘못 재사용되지 않도록)"""
+        with self._dedup_lock:
+            self._dedup_db.execute("DELETE FROM url2path WHERE path = ?", (str(path),))
+            self._dedup_db.execute("DELETE FROM md5set WHERE path = ?", (str(path),))
+            self._dedup_db.commit()
+
+    def _record(self, table: str, key: str, path: Path):
+        """중복 방지 인덱스에 경로 기록"""
+        with self._dedup_lock:
+            self._dedup_db.execute(
+                f"INSERT OR REPLACE INTO {table} VALUES (?, ?)", (key, str(path))
+            )
+            self._dedup_db.commit()
+
     def download_images(
         self,
         urls: List[str],
@@ -99,29 +453,71 @@ class ImageDownloader:
             if image_path:
                 downloaded_images.append(image_path)
 
-        logger.info(f"상품 {product_id}: {len(downloaded_images)}/{len(urls_to_download)} 이미지 다운로드 완료")
+        logger.info(
+            "상품 %s: %d/%d 이미지 다운로드 완료",
+            product_id, len(downloaded_images), len(urls_to_download)
+        )
+        return downloaded_images
+
+    async def download_images_async(
+        self,
+        urls: List[str],
+        product_id: str,
+        max_images: Optional[int] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[Path]:
+        """
+        여러 이미지 동시 다운로드
+
+        Args:
+            urls: 이미지 URL 리스트
+            product_id: 상품 ID
+            max_images: 최대 다운로드 이미지 수
+            client: 공유 HTTP 클라이언트 (없으면 이번 호출용 클라이언트 생성 후 종료)
+
+        Returns:
+            저장된 이미지 경로 리스트 (URL 순서 유지)
+        """
+        urls_to_download = urls[:max_images] if max_images else urls
+
+        if client is None:
+            async with self.create_client() as owned_client:
+                return await self.download_images_async(
+                    urls_to_download,
+                    product_id,
+                    client=owned_client
+                )
+
+        image_paths = await asyncio.gather(*[
+            self.download_image_async(client, url, product_id, idx)
+            for idx, url in enumerate(urls_to_download)
+        ])
+        downloaded_images = [path for path in image_paths if path]
+
+        logger.info(
+            "상품 %s: %d/%d 이미지 다운로드 완료",
+            product_id, len(downloaded_images), len(urls_to_download)
+        )
         return downloaded_images
 
     @staticmethod
     def _get_image_extension(url: str, content_type: str) -> str:
         """이미지 확장자 추출"""
         # URL에서 확장자 추출 시도
-        if '.' in url.split('/')[-1]:
-            ext = '.' + url.split('.')[-1].split('?')[0]
-            if ext.lower() in ['.jpg', '.jpeg', '.png', '.gif', '.webp']:
-                return ext
-
-        # Content-Type에서 추출
-        content_type_map = {
-            'image/jpeg': '.jpg',
-            'image/png': '.png',
-            'image/gif': '.gif',
-            'image/webp': '.webp'
-        }
-        return content_type_map.get(content_type, '.jpg')
+        ext = _extension_from_segment(url.rsplit('/', 1)[-1])
+        if ext:
+            return ext
+
+        # Content-Type에서 추출 (charset 등 파라미터 제외)
+        return _CONTENT_TYPE_MAP.get(content_type.split(';')[0].strip().lower(), '.jpg')
 
     @staticmethod
     def generate_image_hash(image_path: Path) -> str:
         """이미지 해시 생성 (중복 체크용)"""
         with open(image_path, 'rb') as f:
             return hashlib.md5(f.read()).hexdigest()
+
+    def close(self):
+        """동기 다운로드 세션 및 중복 방지 인덱스 DB 연결 종료"""
+        self.session.close()
+        self._dedup_db.close()
@@ -0,0 +1,59 @@
+"""
+JSON 직렬화 유틸리티 (orjson 우선, 없으면 표준 json 사용)
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """
+    들여쓰기(2칸) JSON을 UTF-8 바이트로 직렬화
+
+    Args:
+        obj: 직렬화할 객체
+
+    Returns:
+        UTF-8 인코딩된 JSON 바이트
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=str).encode('utf-8')
+
+
+def dumps_line(obj: Any) -> bytes:
+    """
+    한 줄 JSON을 UTF-8 바이트로 직렬화 (JSONL 기록용, 줄바꿈 미포함)
+
+    Args:
+        obj: 직렬화할 객체 (Path 등 JSON 기본 타입이 아닌 값은 문자열로 변환)
+
+    Returns:
+        UTF-8 인코딩된 JSON 바이트
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    JSON 역직렬화
+
+    Args:
+        data: JSON 바이트 또는 문자열
+
+    Returns:
+        역직렬화된 객체
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -24,6 +24,11 @@ def setup_logger(name: str, log_file: str = None, level=logging.INFO):
     )
 
     logger = logging.getLogger(name)
+
+    # 같은 이름으로 다시 호출되면 핸들러를 중복으로 붙이지 않음
+    if logger.handlers:
+        return logger
+
     logger.setLevel(level)
 
     # 콘솔 핸들러
@@ -0,0 +1,68 @@
+"""
+상품 페이지 HTML 캐시 (SQLite)
+"""
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+
+class PageCache:
+    """URL별 상품 페이지 HTML 캐시"""
+
+    def __init__(self, db_path: Path, expire_after: int = 86400):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            expire_after: 캐시 유효 시간 (초)
+        """
+        self.expire_after = expire_after
+
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, final_url TEXT, html TEXT, fetched_at REAL)"
+        )
+
+    def get(self, url: str) -> Optional[Tuple[str, str]]:
+        """
+        캐시된 페이지 조회
+
+        Args:
+            url: 요청 URL
+
+        Returns:
+            (최종 URL, HTML) 또는 None (없거나 만료된 경우)
+        """
+        row = self.conn.execute(
+            "SELECT final_url, html, fetched_at FROM pages WHERE url = ?",
+            (url,)
+        ).fetchone()
+
+        if row is None or time.time() - row[2] > self.expire_after:
+            return None
+        return row[0], row[1]
+
+    def set(self, url: str, final_url: str, html: str):
+        """
+        페이지 HTML 저장
+
+        Args:
+            url: 요청 URL
+            final_url: 리다이렉트 후 최종 URL
+            html: 페이지 HTML
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)",
+            (url, final_url, html, time.time())
+        )
+        self.conn.commit()
+
+    def close(self):
+        """DB 연결 종료"""
+        self.conn.close()
@@ -0,0 +1,111 @@
+"""
+요청 속도 제한 유틸리티
+"""
+import asyncio
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 429 응답 시 속도를 낮추는 비율과 유지 시간 (초)
+SLOW_DOWN_FACTOR = 0.5
+SLOW_DOWN_DURATION = 60
+
+# 감속 중에도 유지할 최소 속도 (초당 요청 수)
+MIN_RATE = 0.1
+
+
+class TokenBucket:
+    """토큰 버킷 기반 비동기 속도 제한기"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 초당 허용 요청 수
+            burst: 한 번에 허용되는 최대 요청 수
+        """
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.last = time.monotonic()
+        self._slow_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """토큰 1개를 얻을 때까지 대기"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+
+                # 감속 시간이 지나면 원래 속도로 복구
+                if self.rate != self.base_rate and now >= self._slow_until:
+                    self.rate = self.base_rate
+
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                # 감속 중이면 감속이 끝나는 시점에 다시 확인 (복구된 속도로 재계산)
+                wait = (1 - self.tokens) / self.rate
+                if self.rate != self.base_rate:
+                    wait = min(wait, max(self._slow_until - now, 0))
+                await asyncio.sleep(wait)
+
+    def slow_down(
+        self,
+        factor: float = SLOW_DOWN_FACTOR,
+        duration: float = SLOW_DOWN_DURATION
+    ):
+        """
+        일정 시간 동안 요청 속도 낮추기
+
+        여러 번 호출해도 속도는 기본 속도 × factor로 고정되고, 감속 시간만 연장됩니다.
+
+        Args:
+            factor: 기본 속도에 곱할 비율
+            duration: 감속 유지 시간 (초)
+        """
+        self.rate = max(self.base_rate * factor, min(MIN_RATE, self.base_rate))
+        self._slow_until = time.monotonic() + duration
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 속도 제한기"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 호스트당 초당 허용 요청 수
+            burst: 호스트당 한 번에 허용되는 최대 요청 수
+        """
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str) -> TokenBucket:
+        """URL 호스트의 토큰 버킷 (없으면 생성)"""
+        host = urlparse(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    async def acquire(self, url: str):
+        """URL 호스트의 토큰 1개를 얻을 때까지 대기"""
+        await self.bucket(url).acquire()
+
+    def slow_down(self, url: str):
+        """서버가 429를 반환한 호스트의 요청 속도를 일정 시간 절반으로 낮춤"""
+        bucket = self.bucket(url)
+        bucket.slow_down()
+        logger.warning(
+            f"429 응답: {urlparse(url).netloc} 요청 속도를 {bucket.rate:.2f}/s로 낮춥니다 "
+            f"({SLOW_DOWN_DURATION}초)"
+        )